@@ -1,9 +1,6 @@
 from Pcb import PCB
-from process import Process
-
-class ProcessExpropiatedException(Exception):
-    pass
-
+from process import Process, is_p_form, make_sort_key
+from simulator_kernel import run_rr
 
 class ProcessFinishedException(Exception):
     pass
@@ -16,40 +13,37 @@ class RoundRobin:
     This algorithm executes processes in time slices (quantum) and switches between processes after each slice.
     """
 
-    def __init__(self, quantum: int, processes: list[Process], time: int = 0):
+    def __init__(self, quantum: int, processes: list[Process], time: int = 0, tag_is_p_form: bool = None):
         """
         Initializes the Round Robin simulator with a list of processes, quantum time, and initial simulation time.
         
         :param quantum: The time slice (quantum) for each process before it is preempted.
         :param processes: List of ready processes to be executed.
         :param time: The initial simulation time.
+        :param tag_is_p_form: Whether tags follow the "p<number>" format, detected from the queue when None.
         """
         self.__quantum: int = quantum
         self.__time: int = time 
-        self.__initial_time: int = time
         self.__queue: list[Process] = processes
-        self.__current_process_started: int = 0
-        self.__current_process_index: int = 0
+        self.__sort_key = None if tag_is_p_form is None else make_sort_key(tag_is_p_form)
 
     
     def start_processing(self):
         """
         Starts processing the ready queue using the Round Robin algorithm.
-        Processes are executed for a time slice (quantum) before being preempted.
+        Processes are executed for a time slice (quantum) before being preempted, using run_rr.
         """
         self.__order_queue()
-        next_process = self.__next_process()
+        pcbs = [p.get_pcb() for p in self.__queue]
+        at = [pcb.get_at() for pcb in pcbs]
+        bt = [pcb.get_bt() for pcb in pcbs]
 
-        # Continue processing until no processes are left
-        while next_process is not None:
+        rt, ct, wt, tat, self.__time = run_rr(at, bt, self.__quantum, self.__time)
 
-            try:
-                
-                self.__excecute_process(next_process)
+        state_save = self.__state_save
+        for i, pcb in enumerate(pcbs):
+            state_save(pcb, bt[i], rt[i], ct[i], wt[i], tat[i])
 
-            except ProcessExpropiatedException:
-                next_process = self.__next_process()
-                
 
     def get_time(self) -> int:
         """
@@ -60,108 +54,37 @@ class RoundRobin:
         return self.__time
 
 
-    def __excecute_process(self, p: Process) -> None:
-        """
-        Executes a given process for a quantum. If the process finishes before the quantum ends,
-        it is marked as done, otherwise it is preempted.
-        
-        :param p: The process to execute.
-        """
-        self.__current_process_started = self.__time
-        self.__current_process_index = self.__queue.index(p)
-        remaining_time = self.__state_restore(p)
-        
-        for i in range(self.__quantum):
-            
-            self.__time += 1
-            remaining_time -= 1
-
-            if remaining_time == 0:
-                self.__state_save(p)
-                self.__mark_process_done(p)
-                raise ProcessExpropiatedException
-
-            if i == self.__quantum - 1:
-                self.__state_save(p)
-                raise ProcessExpropiatedException
-
-
-    def __next_process(self) -> Process:
-        """
-        Finds and returns the next process to execute. If all processes have been executed,
-        it returns None.
-        
-        :return: The next process to execute, or None if no more processes are left.
-        """
-        try:
-            if self.__time == self.__initial_time:
-                return self.__queue[0]
-
-            for i in range(len(self.__queue) - self.__current_process_index + 1):
-                p = self.__queue[self.__current_process_index + i +1]
-                if not p.get_pcb().is_done():
-                    return p
-
-            raise IndexError        
-        except IndexError:
-            for p in self.__queue:
-                if not p.get_pcb().is_done():
-                    return p
-                continue
-        
-        return None
-    
-    
     def __order_queue(self) -> None:
         """
         Orders the processes in the queue based on their arrival time (AT).
         If arrival times are the same, it orders by process tag.
         """
-        if self.__queue[-1].get_tag().startswith("p"):
-            self.__queue.sort(key= lambda p: (p.get_pcb().get_at(), int(p.get_tag()[1:])))
-        else:
-            self.__queue.sort(key= lambda p: (p.get_pcb().get_at(), p.get_tag()))
-
-    
-    def __state_save(self, p: Process) -> None:
-        """
-        Saves the current state of the process before it is preempted.
-        
-        :param p: The process whose state is being saved.
-        """
-        pcb = p.get_pcb()
-        time_excecuted = self.__time - self.__current_process_started
-        pcb.set_et(self.__time)
-        pcb.set_te(pcb.get_te() + time_excecuted)
+        if self.__sort_key is None:
+            self.__sort_key = make_sort_key(is_p_form(self.__queue[-1].get_tag()))
 
-        # Set response time if this is the first execution
-        if pcb.get_rt() < 0:
-            pcb.set_rt(self.__current_process_started)
-
-    
-    def __state_restore(self, p: Process) -> None:
-        """
-        Restores the remaining burst time of the process to continue execution.
-        
-        :param p: The process whose state is being restored.
-        :return: The remaining burst time for the process.
-        """
-        pcb = p.get_pcb()
-        return pcb.get_bt() - pcb.get_te()
+        self.__queue.sort(key=self.__sort_key)
 
 
-    def __mark_process_done(self, p: Process) -> None:
+    def __state_save(self, pcb: PCB, bt: int, rt: int, ct: int, wt: int, tat: int) -> None:
         """
-        Marks a process as done and calculates its final metrics (Completion Time, Waiting Time, Turnaround Time).
+        Saves the final state and metrics computed by the kernel into a process's PCB
+        and marks it as done.
         
-        :param p: The process to be marked as done.
-        """
-        pcb = p.get_pcb()
+        :param pcb: The PCB of the process whose state is being saved.
+        :param bt: The burst time, fully executed by the end of the simulation.
+        :param rt: The Response Time.
+        :param ct: The Completion Time.
+        :param wt: The Waiting Time.
+        :param tat: The Turnaround Time.
+        """
+        pcb.set_te(bt)
+        pcb.set_et(ct)
+        pcb.set_rt(rt)
         pcb.set_done()
 
-        pcb.set_ct(self.__time)
-        pcb.set_wt(pcb.get_ct() - pcb.get_at() - pcb.get_bt())
-        pcb.set_tat(pcb.get_ct() - pcb.get_at())
+        pcb.set_ct(ct)
+        pcb.set_wt(wt)
+        pcb.set_tat(tat)
     
 
     def __calculate_metrics(self):
@@ -1,4 +1,6 @@
-from process import Process
+from Pcb import PCB
+from process import Process, is_p_form, make_sort_key
+from simulator_kernel import run_fcfs
 
 
 class FCFS:
@@ -7,16 +9,17 @@ class FCFS:
     This algorithm executes processes in the order of their arrival without preemption.
     """
 
-    def __init__(self, proceses: list[Process], time: int):
+    def __init__(self, proceses: list[Process], time: int, tag_is_p_form: bool = None):
         """
         Initializes the FCFS simulator with a list of ready processes and the initial simulation time.
         
         :param processes: List of ready processes to be executed.
         :param time: The initial simulation time.
+        :param tag_is_p_form: Tag format of the queue, see make_sort_key.
         """
         self._ready_queue: list[Process] = proceses
-        self._current_process: int = 0
         self._time: int = time
+        self._sort_key = None if tag_is_p_form is None else make_sort_key(tag_is_p_form)
 
         self.__avg_ct: float = 0.0
         self.__avg_wt: float = 0.0
@@ -27,11 +30,18 @@ class FCFS:
     def start_processing(self) -> None:
         """
         Starts processing the ready queue using the FCFS algorithm.
-        Processes are executed one after another in the order of their arrival.
+        Processes are executed one after another in the order of their arrival, using run_fcfs.
         """
         self._order_queue()
-        for p in self._ready_queue:
-            self._excecute_process()
+        pcbs = [p.get_pcb() for p in self._ready_queue]
+        at = [pcb.get_at() for pcb in pcbs]
+        bt = [pcb.get_bt() for pcb in pcbs]
+
+        rt, ct, wt, tat, self._time = run_fcfs(at, bt, self._time)
+
+        state_save = self._state_save
+        for i, pcb in enumerate(pcbs):
+            state_save(pcb, rt[i], ct[i], wt[i], tat[i])
         
         self._calculate_metrics()
 
@@ -50,28 +60,26 @@ class FCFS:
         Orders the processes in the ready queue based on arrival time (AT).
         If the arrival times are the same, orders by the tag.
         """
-        if self._ready_queue[-1].get_tag().startswith("p"):
-            self._ready_queue.sort(key= lambda p: (p.get_pcb().get_at(), int(p.get_tag()[1:])))
-        else:
-            self._ready_queue.sort(key= lambda p: (p.get_pcb().get_at(), p.get_tag()))
+        if self._sort_key is None:
+            self._sort_key = make_sort_key(is_p_form(self._ready_queue[-1].get_tag()))
 
-    
-    def _excecute_process(self) -> None:
-        """
-        Executes the current process in the ready queue.
-        Updates the process's response time, waiting time, completion time, and turnaround time.
-        """
-        process = self._ready_queue[self._current_process]
-        pcb = process.get_pcb()
-        pcb.set_rt(self._time)
-        pcb.set_wt(self._time - pcb.get_at()) 
+        self._ready_queue.sort(key=self._sort_key)
 
-        self._time += pcb.get_bt()
 
-        pcb.set_ct(self._time) 
-        pcb.set_tat(pcb.get_ct() - pcb.get_at())
+    def _state_save(self, pcb: PCB, rt: int, ct: int, wt: int, tat: int) -> None:
+        """
+        Saves the metrics computed by the kernel into a process's PCB.
         
-        self._current_process += 1
+        :param pcb: The PCB of the process whose state is being saved.
+        :param rt: The Response Time.
+        :param ct: The Completion Time.
+        :param wt: The Waiting Time.
+        :param tat: The Turnaround Time.
+        """
+        pcb.set_rt(rt)
+        pcb.set_wt(wt)
+        pcb.set_ct(ct)
+        pcb.set_tat(tat)
     
     
     def _calculate_metrics(self) -> None:
@@ -80,18 +88,13 @@ class FCFS:
         for all the processes in the ready queue.
         """
         total_processes: int = len(self._ready_queue)
+        pcbs = [p.get_pcb() for p in self._ready_queue]
 
-        for p in self._ready_queue:
-            pcb = p.get_pcb()
-            self.__avg_ct += pcb.get_ct()
-            self.__avg_wt += pcb.get_wt()
-            self.__avg_rt += pcb.get_rt()
-            self.__avg_tat += (pcb.get_ct() - pcb.get_at())
-        
-        self.__avg_ct /= total_processes
-        self.__avg_wt /= total_processes
-        self.__avg_rt /= total_processes
-        self.__avg_tat /= total_processes
+        # Averages are recomputed from scratch so repeated calls do not accumulate
+        self.__avg_ct = sum(pcb.get_ct() for pcb in pcbs) / total_processes
+        self.__avg_wt = sum(pcb.get_wt() for pcb in pcbs) / total_processes
+        self.__avg_rt = sum(pcb.get_rt() for pcb in pcbs) / total_processes
+        self.__avg_tat = sum(pcb.get_ct() - pcb.get_at() for pcb in pcbs) / total_processes
 
     
     def _read_file(self, filename) -> None:
@@ -102,15 +105,14 @@ class FCFS:
         """
         with open(f"./pruebas/{filename}", "r") as f:
 
-            lines = f.read().splitlines()
-            for i in range(len(lines)):
+            for i, line in enumerate(f):
                 
                 if i == 0:
                     continue
                 
-                tag, at, bt = lines[i].split("           ")
+                tag, at, bt = line.split()
             
-                self._ready_queue.append(Process(tag, int(at.strip()), int(bt.strip())))
+                self._ready_queue.append(Process(tag, int(at), int(bt)))
                             
     
     def get_metrics(self) -> None:
@@ -1,8 +1,9 @@
-from process import Process
+from process import Process, is_p_form
 from Pcb import PCB
 from Round_robin import RoundRobin
 from fcfs import FCFS
 
+import io
 import os
 
 class MLQ:
@@ -20,6 +21,7 @@ class MLQ:
         self.__filename: str = filename
         self.__queues : list[list[Process]] = []
         self.__time: int = 0
+        self.__tag_is_p_form: list[bool] = []
 
         self.__read_file(filename)
 
@@ -35,15 +37,15 @@ class MLQ:
 
             if len(self.__queues[i]) > 0:
                 if i == 0: 
-                    rr3 = RoundRobin(3, self.__queues[i], self.__time)
+                    rr3 = RoundRobin(3, self.__queues[i], self.__time, self.__tag_is_p_form[i])
                     rr3.start_processing()
                     self.__time = rr3.get_time()
                 elif i == 1:
-                    rr5 = RoundRobin(5, self.__queues[i], self.__time)
+                    rr5 = RoundRobin(5, self.__queues[i], self.__time, self.__tag_is_p_form[i])
                     rr5.start_processing()
                     self.__time = rr5.get_time()
                 elif i == 2:
-                    fcfs = FCFS(self.__queues[i], self.__time)
+                    fcfs = FCFS(self.__queues[i], self.__time, self.__tag_is_p_form[i])
                     fcfs.start_processing()
                     self.__time = fcfs.get_time()
                 
@@ -55,34 +57,25 @@ class MLQ:
         
         :param filename: The name of the file to read process data from.
         """
-        processes: list[Process] = []
-
-        # Open and read the file
+        # Open the file and read it line by line, growing the queues on demand
         with open(f"./pruebas/{filename}", "r") as f:
-            lines = f.read().splitlines()
-            # Track the highest queue number
-            max_queues = 0
-
-            # Process each line, skipping the header lines
-            for i in range(len(lines)): 
+            for i, line in enumerate(f):
                 # Skip headers
                 if i == 0 or i == 1:
                     continue
                 
-                tag, bt, at, queue, priority = lines[i].split(";")
-                at = int(at.strip())
-                bt = int(bt.strip())
+                tag, bt, at, queue, priority = line.rstrip("\r\n").split(";")
                 queue = int(queue.strip())
-                max_queues = queue if queue > max_queues else max_queues
-                processes.append(Process(tag, at, bt, priority, queue))
 
-        # Initialize empty lists for each queue
-        for i in range(max_queues):
-            self.__queues.append([])
+                # Initialize empty lists up to the highest queue seen so far
+                while len(self.__queues) < queue:
+                    self.__queues.append([])
+                    self.__tag_is_p_form.append(False)
+
+                self.__queues[queue - 1].append(Process(tag, int(at.strip()), int(bt.strip()), priority, queue))
 
-        # Add processes to their respective queues
-        for p in processes:
-            self.__queues[p.get_pcb().get_queue() - 1].append(p)
+                # Each queue's tag format is taken from the last process added to it
+                self.__tag_is_p_form[queue - 1] = is_p_form(tag)
 
 
     def get_metrics(self) -> None:
@@ -99,38 +92,37 @@ class MLQ:
         total_wt, total_ct, total_rt, total_tat = 0, 0, 0, 0
         num_processes = 0
 
+        # Build the whole output in memory and write it at once
+        buf = io.StringIO()
+        buf.write("# etiqueta; BT; AT; Q; Pr; WT; CT; RT; TAT\n")
+
+        # Iterate through each queue and each process to calculate and collect metrics
+        for queue in self.__queues:
+            for p in queue:
+                # Read each field once into a local for the totals and the row
+                pcb = p.get_pcb()
+                wt, ct, rt, tat = pcb.get_wt(), pcb.get_ct(), pcb.get_rt(), pcb.get_tat()
+                bt, at, q, pr = pcb.get_bt(), pcb.get_at(), pcb.get_queue(), pcb.get_priority()
+
+                total_wt += wt
+                total_ct += ct
+                total_rt += rt
+                total_tat += tat
+                num_processes += 1
+
+                buf.write(f"{p.get_tag()}; {bt}; {at}; {q}; {pr}; {wt}; {ct}; {rt}; {tat}\n")
+
+        avg_wt = total_wt / num_processes
+        avg_ct = total_ct / num_processes
+        avg_rt = total_rt / num_processes
+        avg_tat = total_tat / num_processes
+
+        # Average metrics go at the end of the file
+        buf.write(f"WT={avg_wt:.2f}; CT={avg_ct:.2f}; RT={avg_rt:.2f}; TAT={avg_tat:.2f};\n")
+
         # Open the output file for writing
         with open(filename, "w") as f:
-            f.write("# etiqueta; BT; AT; Q; Pr; WT; CT; RT; TAT\n")
-
-            # Iterate through each queue and each process to calculate and write metrics
-            for queue in self.__queues:
-                for p in queue:
-                    pcb = p.get_pcb()
-
-                    wt = pcb.get_wt()
-                    ct = pcb.get_ct()
-                    rt = pcb.get_rt()
-                    tat = pcb.get_tat()
-
-                    
-                    total_wt += wt
-                    total_ct += ct
-                    total_rt += rt
-                    total_tat += tat
-                    num_processes += 1
-
-                    # Write process metrics to the output file
-                    f.write(f"{p.get_tag()}; {pcb.get_bt()}; {pcb.get_at()}; "
-                            f"{pcb.get_queue()}; {pcb.get_priority()}; {wt}; {ct}; {rt}; {tat}\n")
-
-            avg_wt = total_wt / num_processes
-            avg_ct = total_ct / num_processes
-            avg_rt = total_rt / num_processes
-            avg_tat = total_tat / num_processes
-
-            # Write the average metrics at the end of the file
-            f.write(f"WT={avg_wt:.2f}; CT={avg_ct:.2f}; RT={avg_rt:.2f}; TAT={avg_tat:.2f};\n")
+            f.write(buf.getvalue())
 
     
 def main():
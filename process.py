@@ -1,19 +1,55 @@
 import sys
 sys.path.append("./RR/")
 
+from typing import Optional
+
 from Pcb import PCB
 
 class Process:
     
-    def __init__(self, tag: str, at: int, bt: int, priority: int, queue: int = None):
+    def __init__(self, tag: str, at: int, bt: int, priority: int = 0, queue: int = None):
         self.__tag: str = tag
+        # Tags like "p1", "p2" are ordered by their number, parsed once here
+        self.__tag_id: Optional[int] = int(tag[1:]) if is_p_form(tag) else None
         self.__pcb: PCB = PCB(at, bt, priority, queue)
     
     def get_tag(self) -> str:
         return self.__tag
 
+    def get_tag_id(self) -> Optional[int]:
+        return self.__tag_id
+
     def get_pcb(self) -> PCB:
         return self.__pcb
 
     def get_info(self) -> str:
         return f"Tag: {self.__tag}  AT: {self.__pcb.get_at()}  BT: {self.__pcb.get_bt()}  CT: {self.__pcb.get_ct()}  WT: {self.__pcb.get_wt()}  RT: {self.__pcb.get_rt()}  TAT: {self.__pcb.get_tat()}"
+
+
+def is_p_form(tag: str) -> bool:
+    """
+    Tells whether a tag follows the "p<number>" format, like "p1" or "p12".
+
+    :param tag: The process tag.
+    :return: True if the tag is a "p" followed by digits.
+    """
+    return tag.startswith("p") and tag[1:].isdigit()
+
+
+def make_sort_key(tag_is_p_form: bool):
+    """
+    Builds the key used to order a queue: arrival time (AT), then tag.
+    Tags in the "p<number>" format are compared by their number.
+
+    :param tag_is_p_form: Whether tags follow the "p<number>" format.
+    :return: The key function for sorting processes.
+    """
+    if tag_is_p_form:
+        def p_form_key(p: Process) -> tuple:
+            tag_id = p.get_tag_id()
+            if tag_id is None:
+                raise ValueError(f'Tag "{p.get_tag()}" is not in the "p<number>" format used by its queue')
+            return (p.get_pcb().get_at(), tag_id)
+
+        return p_form_key
+    return lambda p: (p.get_pcb().get_at(), p.get_tag())
@@ -0,0 +1,71 @@
+from collections import deque
+from itertools import accumulate
+from operator import sub
+
+
+def run_rr(at: list[int], bt: list[int], quantum: int, start_time: int) -> tuple:
+    """
+    Runs the Round Robin simulation over flat lists of arrival and burst times.
+    Processes are taken in the given order and revisited circularly, each one running
+    for a quantum (or what is left of its burst) before the next one is picked.
+    The loop only touches plain integers, no Process or PCB objects.
+
+    :param at: Arrival time of each process, in queue order.
+    :param bt: Burst time of each process, in queue order.
+    :param quantum: The time slice (quantum) for each process before it is preempted.
+    :param start_time: The simulation time at which the first process starts.
+    :return: A tuple (rt, ct, wt, tat, time) with the per-process metrics and the final simulation time.
+    """
+    n = len(bt)
+    remaining = list(bt)
+    rt = [-1] * n
+    ct = [0] * n
+    t = start_time
+
+    # Indices of the processes that are not done yet, in the order they will run
+    ready = deque(range(n))
+    rotate = ready.rotate
+    popleft = ready.popleft
+
+    while ready:
+        # Run the whole slice at once: either the full quantum or what is left of the burst
+        idx = ready[0]
+        left = remaining[idx]
+        if rt[idx] < 0:
+            rt[idx] = t
+
+        # The last process left runs to completion without being preempted again
+        if left > quantum and len(ready) > 1:
+            t += quantum
+            remaining[idx] = left - quantum
+            rotate(-1)
+        else:
+            t += left
+            remaining[idx] = 0
+            ct[idx] = t
+            popleft()
+
+    wt = [ct[i] - at[i] - bt[i] for i in range(n)]
+    tat = [ct[i] - at[i] for i in range(n)]
+
+    return rt, ct, wt, tat, t
+
+
+def run_fcfs(at: list[int], bt: list[int], start_time: int) -> tuple:
+    """
+    Runs the First Come First Serve simulation over flat lists of arrival and burst times.
+    Processes are executed one after another in the given order without preemption.
+
+    :param at: Arrival time of each process, in queue order.
+    :param bt: Burst time of each process, in queue order.
+    :param start_time: The simulation time at which the first process starts.
+    :return: A tuple (rt, ct, wt, tat, time) with the per-process metrics and the final simulation time.
+    """
+    # Start and completion times are the prefix sum of the burst times
+    times = list(accumulate(bt, initial=start_time))
+    rt = times[:-1]
+    ct = times[1:]
+    wt = list(map(sub, rt, at))
+    tat = list(map(sub, ct, at))
+
+    return rt, ct, wt, tat, times[-1]